@@ -2,6 +2,32 @@ import pyblish.api
 from ayon_core.pipeline import PublishValidationError
 from pymxs import runtime as rt
 
+# Find invalid members completely in MAXScript and return only 1-based
+# indices of members which are not tyFlow object(s) or editable mesh(es)
+# and of members without any 'Export_Particles' sub-anim.
+MS_FIND_INVALID_TYFLOW = """
+fn ayon_find_invalid_tyflow members = (
+    local invalid_objects = #()
+    local invalid_operators = #()
+    -- resolve the allowed classes once instead of per member
+    local allowed_classes = #(tyFlow, Editable_Mesh)
+    for i = 1 to members.count do (
+        local s = members[i]
+        if (findItem allowed_classes (classOf s)) == 0 do (
+            append invalid_objects i
+        )
+
+        local obj = s.baseobject
+        local has_export = false
+        for a in (getSubAnimNames obj) while not has_export do (
+            has_export = isProperty (getSubAnim obj a) "Export_Particles"
+        )
+        if not has_export do append invalid_operators i
+    )
+    #(invalid_objects, invalid_operators)
+)
+"""
+
 
 class ValidateTyFlowData(pyblish.api.InstancePlugin):
     """Validate TyFlow plugins or relevant operators are set correctly."""
@@ -19,11 +45,12 @@ class ValidateTyFlowData(pyblish.api.InstancePlugin):
 
         """
 
-        invalid_object = self.get_tyflow_object(instance)
+        invalid_object, invalid_operator = self._scan(instance)
         if invalid_object:
-            self.log.error(f"Non tyFlow object found: {invalid_object}")
+            self.log.error(
+                "Non tyFlow object found: %s",
+                self._summarize_nodes(invalid_object))
 
-        invalid_operator = self.get_tyflow_operator(instance)
         if invalid_operator:
             self.log.error(
                 "Operator 'Export Particles' not found in tyFlow editor.")
@@ -34,55 +61,47 @@ class ValidateTyFlowData(pyblish.api.InstancePlugin):
                 "and tyflow operator 'Export Particle' should be in "
                 "the tyFlow editor.")
 
-    def get_tyflow_object(self, instance):
-        """Get the nodes which are not tyFlow object(s)
-        and editable mesh(es)
+    @staticmethod
+    def _summarize_nodes(nodes, limit=5):
+        """Get short description of nodes for logging.
+
+        Only the first nodes are named to keep the message short for
+        containers with thousands of members. Node names are used because
+        converting nodes to string evaluates 'as string' in MAXScript.
 
         Args:
-            instance (pyblish.api.Instance): instance
+            nodes (list): nodes to describe
+            limit (int): maximum number of named nodes
 
         Returns:
-            list: invalid nodes which are not tyFlow
-                object(s) and editable mesh(es).
+            str: comma separated node names
         """
-        container = instance.data["instance_node"]
-        self.log.debug(f"Validating tyFlow container for {container}")
+        summary = ", ".join(node.name for node in nodes[:limit])
+        if len(nodes) > limit:
+            summary += f" ...and {len(nodes) - limit} more"
+        return summary
 
-        allowed_classes = [rt.tyFlow, rt.Editable_Mesh]
-        return [
-            member for member in instance.data["members"]
-            if rt.ClassOf(member) not in allowed_classes
-        ]
-
-    def get_tyflow_operator(self, instance):
-        """Check if the Export Particle Operators in the node
-        connections.
+    def _scan(self, instance):
+        """Get invalid tyFlow objects and operators in a single pass.
 
         Args:
-            instance (str): instance node
+            instance (pyblish.api.Instance): instance
 
         Returns:
-            invalid(list): list of invalid nodes which do
-            not consist of Export Particle Operators as parts
-            of the node connections
+            tuple: list of invalid nodes which are not tyFlow object(s)
+                and editable mesh(es) and list of invalid nodes which do
+                not consist of Export Particle Operators as parts of
+                the node connections.
         """
-        invalid = []
+        container = instance.data["instance_node"]
+        self.log.debug("Validating tyFlow container for %s", container)
+
         members = instance.data["members"]
-        for member in members:
-            obj = member.baseobject
-
-            # There must be at least one animation with export
-            # particles enabled
-            has_export_particles = False
-            anim_names = rt.GetSubAnimNames(obj)
-            for anim_name in anim_names:
-                # get name of the related tyFlow node
-                sub_anim = rt.GetSubAnim(obj, anim_name)
-                # check if there is export particle operator
-                if rt.IsProperty(sub_anim, "Export_Particles"):
-                    has_export_particles = True
-                    break
-
-            if not has_export_particles:
-                invalid.append(member)
-        return invalid
+        find_invalid = rt.Execute(MS_FIND_INVALID_TYFLOW)
+        invalid_object_ids, invalid_operator_ids = find_invalid(members)
+
+        invalid_objects = [members[idx - 1] for idx in invalid_object_ids]
+        # There must be at least one animation with export
+        # particles enabled
+        invalid_operators = [members[idx - 1] for idx in invalid_operator_ids]
+        return invalid_objects, invalid_operators
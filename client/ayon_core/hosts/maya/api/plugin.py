@@ -6,7 +6,7 @@ import qargparse
 import six
 import ayon_api
 from maya import cmds
-from maya.app.renderSetup.model import renderSetup
+import maya.api.OpenMaya as om
 
 from ayon_core.lib import BoolDef, Logger
 from ayon_core.settings import get_project_settings
@@ -37,6 +37,10 @@ from .pipeline import containerise
 
 log = Logger.get_logger()
 
+# Render setup list observers registered by renderlayer creators by creator
+#   identifier, creators are recreated on each create context reset
+_render_layers_observers = {}
+
 
 def _get_attr(node, attr, default=None):
     """Helper to get attribute which allows attribute to not exist."""
@@ -398,10 +402,84 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
     # These are optional to be overridden in subclass
     layer_instance_prefix = None
 
+    def __init__(self, *args, **kwargs):
+        super(RenderlayerCreator, self).__init__(*args, **kwargs)
+        # Cached result of the singleton node scene lookup
+        self._singleton_cache = None
+        # Whether the singleton node exists, 'None' if not resolved yet
+        self._has_singleton = None
+        # Render setup layers cached until render setup layers change
+        self._render_layers_cache = None
+        self._render_setup_observed = None
+
+    def _get_render_layers(self):
+        """Return render setup layers of the scene.
+
+        The layers are cached and the cache is dropped by a render setup
+        list observer whenever layers are added, removed or reordered.
+
+        Returns:
+            list: Render setup layers.
+
+        """
+        # Import on first use to keep module import light for other creators
+        from maya.app.renderSetup.model import renderSetup
+
+        rs = renderSetup.instance()
+        # Render setup instance changes e.g. when a new scene is opened
+        if self._render_setup_observed is not rs:
+            # Unregister observer of previous creator of the same identifier
+            #   so render setup doesn't keep calling stale creators
+            previous = _render_layers_observers.pop(self.identifier, None)
+            if previous is not None:
+                previous_rs, previous_observer = previous
+                if previous_rs is rs:
+                    rs.removeListObserver(previous_observer)
+
+            rs.addListObserver(self._on_render_layers_changed)
+            _render_layers_observers[self.identifier] = (
+                rs, self._on_render_layers_changed
+            )
+            self._render_setup_observed = rs
+            self._render_layers_cache = None
+
+        if self._render_layers_cache is None:
+            self._render_layers_cache = rs.getRenderLayers()
+        return list(self._render_layers_cache)
+
+    def _on_render_layers_changed(self, *args, **kwargs):
+        self._render_layers_cache = None
+
     def _get_singleton_node(self, return_all=False):
-        nodes = lib.lsattr("pre_creator_identifier", self.identifier)
+        # All nodes are requested e.g. on removal, so always scan the whole
+        # scene to find also duplicated or imported singleton nodes
+        if return_all:
+            nodes = lib.lsattr("pre_creator_identifier", self.identifier)
+            self._singleton_cache = nodes or None
+            return nodes or None
+
+        # Reuse the previous lookup as long as the nodes still exist to
+        # avoid scanning the whole scene on each call
+        nodes = None
+        if self._singleton_cache:
+            nodes = cmds.ls(self._singleton_cache)
+
+        # The singleton node is created with a known name so check that
+        # node first before the scene-wide scan
+        if not nodes and self.singleton_node_name:
+            nodes = [
+                node
+                for node in cmds.ls(self.singleton_node_name,
+                                    type="objectSet")
+                if _get_attr(node, "pre_creator_identifier") == self.identifier
+            ]
+
+        if not nodes:
+            nodes = lib.lsattr("pre_creator_identifier", self.identifier)
+            self._singleton_cache = nodes or None
+
         if nodes:
-            return nodes if return_all else nodes[0]
+            return nodes[0]
 
     def create(self, product_name, instance_data, pre_create_data):
         # A Renderlayer is never explicitly created using the create method.
@@ -411,9 +489,13 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
 
         # if no render layers are present, create default one with
         # asterisk selector
-        rs = renderSetup.instance()
-        if not rs.getRenderLayers():
+        if not self._get_render_layers():
+            from maya.app.renderSetup.model import renderSetup
+
+            rs = renderSetup.instance()
             render_layer = rs.createRenderLayer("Main")
+            # Don't rely on the list observer being triggered synchronously
+            self._render_layers_cache = None
             collection = render_layer.createCollection("defaultCollection")
             collection.getSelector().setPattern('*')
 
@@ -432,20 +514,29 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
             lib.imprint(node, data={
                 "pre_creator_identifier": self.identifier
             })
+        self._singleton_cache = [node]
+        self._has_singleton = True
 
         return node
 
     def collect_instances(self):
 
         # We only collect if the global render instance exists
-        if not self._get_singleton_node():
+        if self._has_singleton is False:
+            return
+
+        singleton_node = self._get_singleton_node()
+        self._has_singleton = bool(singleton_node)
+        if not singleton_node:
             return
 
+        layer_instance_nodes = self._get_layer_instance_nodes(singleton_node)
+
         host_name = self.create_context.host_name
-        rs = renderSetup.instance()
-        layers = rs.getRenderLayers()
-        for layer in layers:
-            layer_instance_node = self.find_layer_instance_node(layer)
+        for layer in self._get_render_layers():
+            # Resolve the layer name only once, it's queried through Maya
+            layer_name = layer.name()
+            layer_instance_node = layer_instance_nodes.get(layer_name)
             if layer_instance_node:
                 data = self.read_instance_node(layer_instance_node)
                 instance = CreatedInstance.from_existing(data, creator=self)
@@ -459,7 +550,7 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
                 instance_data = {
                     "folderPath": folder_path,
                     "task": task_name,
-                    "variant": layer.name(),
+                    "variant": layer_name,
                 }
                 folder_entity = ayon_api.get_folder_by_path(
                     project_name, folder_path
@@ -471,7 +562,7 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
                     project_name,
                     folder_entity,
                     task_entity,
-                    layer.name(),
+                    layer_name,
                     host_name,
                 )
 
@@ -485,24 +576,64 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
             instance.transient_data["layer"] = layer
             self._add_instance_to_context(instance)
 
-    def find_layer_instance_node(self, layer):
-        connected_sets = cmds.listConnections(
-            "{}.message".format(layer.name()),
-            source=False,
-            destination=True,
-            type="objectSet"
+    def _get_layer_instance_nodes(self, singleton_node):
+        """Return renderlayer instance nodes by their renderlayer name.
+
+        All instance nodes are members of the singleton node, so the
+        renderlayer links are queried for all of them at once instead of
+        querying connections of each renderlayer separately.
+
+        Args:
+            singleton_node (str): The singleton node of this creator.
+
+        Returns:
+            dict[str, str]: Instance node by renderlayer node name.
+
+        """
+        members = cmds.sets(singleton_node, query=True) or []
+        if not members:
+            return {}
+
+        connections = cmds.listConnections(
+            members,
+            source=True,
+            destination=False,
+            type="renderSetupLayer",
+            connections=True
         ) or []
 
-        for node in connected_sets:
-            if not cmds.attributeQuery("creator_identifier",
-                                       node=node,
-                                       exists=True):
+        layer_instance_nodes = {}
+        for plug, layer_name in zip(connections[::2], connections[1::2]):
+            node, attr = plug.split(".", 1)
+            if attr != "renderlayer":
                 continue
 
-            creator_identifier = cmds.getAttr(node + ".creator_identifier")
-            if creator_identifier == self.identifier:
-                self.log.info("Found node: {}".format(node))
-                return node
+            if _get_attr(node, "creator_identifier") == self.identifier:
+                layer_instance_nodes[layer_name] = node
+        return layer_instance_nodes
+
+    def find_layer_instance_node(self, layer):
+        selection_list = om.MSelectionList()
+        selection_list.add(layer.name())
+        layer_fn = om.MFnDependencyNode(selection_list.getDependNode(0))
+
+        # Walk the message connections through the API to avoid string
+        # based plug lookups and an attribute query per connected set
+        node_fn = om.MFnDependencyNode()
+        for plug in layer_fn.findPlug("message", False).destinations():
+            node = plug.node()
+            if not node.hasFn(om.MFn.kSet):
+                continue
+
+            node_fn.setObject(node)
+            if not node_fn.hasAttribute("creator_identifier"):
+                continue
+
+            identifier_plug = node_fn.findPlug("creator_identifier", False)
+            if identifier_plug.asString() == self.identifier:
+                node_name = node_fn.name()
+                self.log.info(f"Found node: {node_name}")
+                return node_name
 
     def _create_layer_instance_node(self, layer):
 
@@ -512,18 +643,17 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
             raise CreatorError("Creating a renderlayer instance node is not "
                                "allowed if no 'CreateRender' instance exists")
 
-        namespace = "_{}".format(self.singleton_node_name)
-        namespace = ensure_namespace(namespace)
+        namespace = ensure_namespace(f"_{self.singleton_node_name}")
 
-        name = "{}:{}".format(namespace, layer.name())
-        render_set = cmds.sets(name=name, empty=True)
+        layer_name = layer.name()
+        render_set = cmds.sets(name=f"{namespace}:{layer_name}", empty=True)
 
         # Keep an active link with the renderlayer so we can retrieve it
         # later by a physical maya connection instead of relying on the layer
         # name
         cmds.addAttr(render_set, longName="renderlayer", at="message")
-        cmds.connectAttr("{}.message".format(layer.name()),
-                         "{}.renderlayer".format(render_set), force=True)
+        cmds.connectAttr(f"{layer_name}.message",
+                         f"{render_set}.renderlayer", force=True)
 
         # Add the set to the 'CreateRender' set.
         cmds.sets(render_set, forceElement=create_render_set)
@@ -533,17 +663,19 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
     def update_instances(self, update_list):
         # We only generate the persisting layer data into the scene once
         # we save with the UI on e.g. validate or publish
-        for instance, _changes in update_list:
-            instance_node = instance.data.get("instance_node")
+        # Batch all scene edits into one undo chunk without viewport redraws
+        with lib.undo_chunk(), lib.suspended_refresh():
+            for instance, _changes in update_list:
+                instance_node = instance.data.get("instance_node")
 
-            # Ensure a node exists to persist the data to
-            if not instance_node:
-                layer = instance.transient_data["layer"]
-                instance_node = self._create_layer_instance_node(layer)
-                instance.data["instance_node"] = instance_node
+                # Ensure a node exists to persist the data to
+                if not instance_node:
+                    layer = instance.transient_data["layer"]
+                    instance_node = self._create_layer_instance_node(layer)
+                    instance.data["instance_node"] = instance_node
 
-            self.imprint_instance_node(instance_node,
-                                       data=instance.data_to_store())
+                self.imprint_instance_node(instance_node,
+                                           data=instance.data_to_store())
 
     def imprint_instance_node(self, node, data):
         # Do not ever try to update the `renderlayer` since it'll try
@@ -567,9 +699,9 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
         # Instead of removing the single instance or renderlayers we instead
         # remove the CreateRender node this creator relies on to decide whether
         # it should collect anything at all.
-        nodes = self._get_singleton_node(return_all=True)
-        if nodes:
-            cmds.delete(nodes)
+        nodes = self._get_singleton_node(return_all=True) or []
+        self._singleton_cache = None
+        self._has_singleton = False
 
         # Remove ALL the instances even if only one gets deleted
         for instance in list(self.create_context.instances):
@@ -578,8 +710,13 @@ class RenderlayerCreator(NewCreator, MayaCreatorBase):
 
                 # Remove the stored settings per renderlayer too
                 node = instance.data.get("instance_node")
-                if node and cmds.objExists(node):
-                    cmds.delete(node)
+                if node:
+                    nodes.append(node)
+
+        # Delete all nodes with a single command
+        existing_nodes = cmds.ls(nodes) if nodes else []
+        if existing_nodes:
+            cmds.delete(existing_nodes)
 
     def get_product_name(
         self,
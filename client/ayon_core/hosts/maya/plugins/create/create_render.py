@@ -33,9 +33,15 @@ class CreateRenderlayer(plugin.RenderlayerCreator):
 
     render_settings = {}
 
+    # Instance attribute definitions built once per settings change
+    _attr_defs = []
+
     @classmethod
     def apply_settings(cls, project_settings):
         cls.render_settings = project_settings["maya"]["render_settings"]
+        cls._attr_defs = cls._create_instance_attr_defs(
+            cls.render_settings.get("enable_all_lights", False)
+        )
 
     def create(self, product_name, instance_data, pre_create_data):
         # Only allow a single render instance to exist
@@ -54,6 +60,10 @@ class CreateRenderlayer(plugin.RenderlayerCreator):
     def get_instance_attr_defs(self):
         """Create instance settings."""
 
+        return list(self._attr_defs)
+
+    @staticmethod
+    def _create_instance_attr_defs(include_lights_default):
         return [
             BoolDef("review",
                     label="Review",
@@ -103,6 +113,5 @@ class CreateRenderlayer(plugin.RenderlayerCreator):
 
             BoolDef("renderSetupIncludeLights",
                     label="Render Setup Include Lights",
-                    default=self.render_settings.get("enable_all_lights",
-                                                     False))
+                    default=include_lights_default)
         ]
@@ -130,8 +130,9 @@ def frames_to_seconds(frames, framerate):
         float: second value
     """
 
-    rt = _ot.from_frames(frames, framerate)
-    return _ot.to_seconds(rt)
+    # same as 'to_seconds(from_frames(frames, framerate))' where
+    #   'from_frames' truncates frames to whole number
+    return int(frames) / float(framerate)
 
 
 def frames_to_timecode(frames, framerate):
@@ -154,14 +155,13 @@ def make_sequence_collection(path, otio_range, metadata):
     """
     if "%" not in path:
         return None
-    file_name = os.path.basename(path)
-    dir_path = os.path.dirname(path)
-    head = file_name.split("%")[0]
-    tail = os.path.splitext(file_name)[-1]
+    dir_path, file_name = os.path.split(path)
+    stem, tail = os.path.splitext(file_name)
+    head = stem.split("%", 1)[0]
     first, last = otio_range_to_frame_range(otio_range)
     collection = clique.Collection(
         head=head, tail=tail, padding=metadata["padding"])
-    collection.indexes.update([i for i in range(first, last)])
+    collection.indexes.update(range(first, last))
     return dir_path, collection
 
 
@@ -15,8 +15,9 @@ Provides:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-import clique
 from pyblish import api
 
 from ayon_core.lib import (
@@ -26,6 +27,16 @@ from ayon_core.lib import (
 from ayon_core.pipeline import publish
 
 
+@lru_cache(maxsize=1)
+def _get_ffmpeg_args():
+    """Arguments to launch ffmpeg, resolved only once per process.
+
+    Returns:
+        tuple[str]: ffmpeg launch arguments.
+    """
+    return tuple(get_ffmpeg_tool_args("ffmpeg"))
+
+
 class ExtractOTIOReview(publish.Extractor):
     """
     Extract OTIO timeline into one concuted image sequence file.
@@ -41,6 +52,9 @@ class ExtractOTIOReview(publish.Extractor):
 
     At the moment only image sequence output is supported
 
+    Rendering runs in background so ffmpeg processes of multiple review
+    instances can overlap. The `WaitOTIOReview` plugin waits for them.
+
     """
 
     order = api.ExtractorOrder - 0.45
@@ -54,6 +68,17 @@ class ExtractOTIOReview(publish.Extractor):
     to_height = 720
     output_ext = ".jpg"
 
+    # shared pool running ffmpeg processes of all review instances
+    _render_executor = None
+
+    @classmethod
+    def _get_render_executor(cls):
+        if cls._render_executor is None:
+            cls._render_executor = ThreadPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 2) // 2)
+            )
+        return cls._render_executor
+
     def process(self, instance):
         # Not all hosts can import these modules.
         import opentimelineio as otio
@@ -72,11 +97,27 @@ class ExtractOTIOReview(publish.Extractor):
 
         # add plugin wide attributes
         self.representation_files = list()
-        self.used_frames = list()
+        self._segments = list()
         self.workfile_start = int(instance.data.get(
             "workfileFrameStart", 1001)) - handle_start
         self.padding = len(str(self.workfile_start))
-        self.used_frames.append(self.workfile_start)
+        # used frames are always contiguous so only the first and
+        #   the last used frame (cursor) are tracked
+        self._min_frame = self.workfile_start
+        self._cursor = self.workfile_start
+        # first segment starts at the cursor frame, not after it
+        self._first_frame_pending = True
+        # all segments are conformed to single resolution so they can be
+        #   concatenated, use instance resolution if available
+        self._output_resolution = None
+        if (
+            instance.data.get("resolutionWidth")
+            and instance.data.get("resolutionHeight")
+        ):
+            self._output_resolution = (
+                int(instance.data["resolutionWidth"]),
+                int(instance.data["resolutionHeight"])
+            )
         self.to_width = instance.data.get(
             "resolutionWidth") or self.to_width
         self.to_height = instance.data.get(
@@ -90,18 +131,42 @@ class ExtractOTIOReview(publish.Extractor):
             return
         else:
             self.staging_dir = self.staging_dir(instance)
+            # path to destination image sequence
+            self._output_pattern = os.path.join(
+                self.staging_dir,
+                f"{self.temp_file_head}%0{self.padding}d{self.output_ext}"
+            )
             if not instance.data.get("representations"):
                 instance.data["representations"] = list()
 
+        # resolve per clip values only once before processing
+        clips_info = []
+        for r_otio_cl in otio_review_clips:
+            is_clip = isinstance(r_otio_cl, otio.schema.Clip)
+            media_ref = r_otio_cl.media_reference
+            clips_info.append((
+                is_clip,
+                r_otio_cl.source_range,
+                r_otio_cl.available_range() if is_clip else None,
+                media_ref,
+                media_ref.metadata,
+            ))
+        clips_count = len(clips_info)
+
         # loop available clips in otio track
-        for index, r_otio_cl in enumerate(otio_review_clips):
+        for index, clip_info in enumerate(clips_info):
             # QUESTION: what if transition on clip?
+            (
+                is_clip,
+                src_range,
+                available_range,
+                media_ref,
+                media_metadata
+            ) = clip_info
 
             # check if resolution is the same
             width = self.to_width
             height = self.to_height
-            otio_media = r_otio_cl.media_reference
-            media_metadata = otio_media.metadata
 
             # get from media reference metadata source
             if media_metadata.get("openpype.source.width"):
@@ -120,40 +185,44 @@ class ExtractOTIOReview(publish.Extractor):
             ))
 
             # get frame range values
-            src_range = r_otio_cl.source_range
             start = src_range.start_time.value
             duration = src_range.duration.value
-            available_range = None
             self.actual_fps = src_range.duration.rate
 
-            # add available range only if not gap
-            if isinstance(r_otio_cl, otio.schema.Clip):
-                available_range = r_otio_cl.available_range()
+            # available range is set only if not gap
+            if available_range:
                 self.actual_fps = available_range.duration.rate
 
             # reframing handles conditions
-            if (len(otio_review_clips) > 1) and (index == 0):
+            if (clips_count > 1) and (index == 0):
                 # more clips | first clip reframing with handle
                 start -= handle_start
                 duration += handle_start
-            elif len(otio_review_clips) > 1 \
-                    and (index == len(otio_review_clips) - 1):
+            elif clips_count > 1 and (index == clips_count - 1):
                 # more clips | last clip reframing with handle
                 duration += handle_end
-            elif len(otio_review_clips) == 1:
+            elif clips_count == 1:
                 # one clip | add both handles
                 start -= handle_start
                 duration += (handle_start + handle_end)
 
+            pre_gap_duration = post_gap_duration = 0
             if available_range:
-                available_range = self._trim_available_range(
+                (
+                    available_range,
+                    pre_gap_duration,
+                    post_gap_duration
+                ) = self._trim_available_range(
                     available_range, start, duration, self.actual_fps)
 
+            # missing media before clip source range is filled with gap
+            if pre_gap_duration:
+                self._add_segment(gap=pre_gap_duration)
+                self._generate_used_frames(pre_gap_duration)
+
             # process all track items of the track
-            if isinstance(r_otio_cl, otio.schema.Clip):
+            if is_clip:
                 # process Clip
-                media_ref = r_otio_cl.media_reference
-                metadata = media_ref.metadata
                 is_sequence = None
 
                 # check in two way if it is sequence
@@ -164,7 +233,7 @@ class ExtractOTIOReview(publish.Extractor):
                         is_sequence = True
                 else:
                     # for OpenTimelineIO 0.12 and older
-                    if metadata.get("padding"):
+                    if media_metadata.get("padding"):
                         is_sequence = True
 
                 if is_sequence:
@@ -173,40 +242,52 @@ class ExtractOTIOReview(publish.Extractor):
                         dirname = media_ref.target_url_base
                         head = media_ref.name_prefix
                         tail = media_ref.name_suffix
+                        padding = media_ref.frame_zero_padding
                         first, last = otio_range_to_frame_range(
                             available_range)
-                        collection = clique.Collection(
-                            head=head,
-                            tail=tail,
-                            padding=media_ref.frame_zero_padding
+                        # frames are contiguous so no collection is needed
+                        frame_duration = last - first + 1
+                        input_path = os.path.join(
+                            dirname,
+                            "{}{}{}".format(
+                                head,
+                                "%0{}d".format(padding) if padding else "%d",
+                                tail
+                            )
                         )
-                        collection.indexes.update(
-                            [i for i in range(first, (last + 1))])
-                        # render segment
-                        self._render_seqment(
-                            sequence=[dirname, collection])
+                        # add segment
+                        self._add_segment(
+                            sequence=[input_path, first, frame_duration])
                         # generate used frames
-                        self._generate_used_frames(
-                            len(collection.indexes))
+                        self._generate_used_frames(frame_duration)
                     else:
                         # in case it is file sequence but not new OTIO schema
                         # `ImageSequenceReference`
                         path = media_ref.target_url
                         collection_data = make_sequence_collection(
-                            path, available_range, metadata)
+                            path, available_range, media_metadata)
                         dir_path, collection = collection_data
+                        frame_duration = len(collection.indexes)
+                        input_path = os.path.join(
+                            dir_path,
+                            collection.format("{head}{padding}{tail}")
+                        )
 
-                        # render segment
-                        self._render_seqment(
-                            sequence=[dir_path, collection])
+                        # add segment
+                        self._add_segment(
+                            sequence=[
+                                input_path,
+                                min(collection.indexes),
+                                frame_duration
+                            ]
+                        )
                         # generate used frames
-                        self._generate_used_frames(
-                            len(collection.indexes))
+                        self._generate_used_frames(frame_duration)
                 else:
                     # single video file way
                     path = media_ref.target_url
-                    # render video file to sequence
-                    self._render_seqment(
+                    # add video file segment
+                    self._add_segment(
                         video=[path, available_range])
                     # generate used frames
                     self._generate_used_frames(
@@ -214,10 +295,20 @@ class ExtractOTIOReview(publish.Extractor):
             # QUESTION: what if nested track composition is in place?
             else:
                 # at last process a Gap
-                self._render_seqment(gap=duration)
+                self._add_segment(gap=duration)
                 # generate used frames
                 self._generate_used_frames(duration)
 
+            # missing media after clip source range is filled with gap
+            if post_gap_duration:
+                self._add_segment(gap=post_gap_duration)
+                self._generate_used_frames(post_gap_duration)
+
+        # render all segments with single ffmpeg process in background
+        #   - used frames are known already so representation can be
+        #   created before rendering finishes
+        instance.data["otioReviewRenderFuture"] = self._render_segments()
+
         # creating and registering representation
         representation = self._create_representation(start, duration)
         instance.data["representations"].append(representation)
@@ -245,17 +336,13 @@ class ExtractOTIOReview(publish.Extractor):
             "tags": ["review", "delete"]
         }
 
-        collection = clique.Collection(
-            self.temp_file_head,
-            tail=self.output_ext,
-            padding=self.padding,
-            indexes=set(self.used_frames)
+        # used frames are contiguous so files can be formatted directly
+        start = self._min_frame
+        end = self._cursor
+        files = self._contiguous_files(
+            self.temp_file_head, self.output_ext, self.padding, start, end
         )
-        start = min(collection.indexes)
-        end = max(collection.indexes)
-
-        files = [f for f in collection]
-        ext = collection.format("{tail}")
+        ext = self.output_ext
         representation_data.update({
             "name": ext[1:],
             "ext": ext[1:],
@@ -265,6 +352,26 @@ class ExtractOTIOReview(publish.Extractor):
         })
         return representation_data
 
+    @staticmethod
+    def _contiguous_files(head, tail, padding, start, end):
+        """
+        File names of contiguous frame sequence.
+
+        Args:
+            head (str): file name part before frame number
+            tail (str): file name part after frame number
+            padding (int): frame number padding
+            start (int): first frame
+            end (int): last frame (inclusive)
+
+        Returns:
+            list[str]: file names
+        """
+        # build the format string once instead of nested format spec
+        #   evaluated for each frame
+        file_pattern = f"{head}{{:0{padding}d}}{tail}"
+        return [file_pattern.format(frame) for frame in range(start, end + 1)]
+
     def _trim_available_range(self, avl_range, start, duration, fps):
         """
         Trim available media range to source range.
@@ -279,7 +386,8 @@ class ExtractOTIOReview(publish.Extractor):
             fps (float): frame rate
 
         Returns:
-            otio.time.TimeRange: trimmed available range
+            tuple[otio.time.TimeRange, int, int]: trimmed available range,
+                duration of gap before and after the trimmed range
         """
         # Not all hosts can import these modules.
         from ayon_core.pipeline.editorial import (
@@ -291,83 +399,62 @@ class ExtractOTIOReview(publish.Extractor):
         src_start = int(avl_start + start)
         avl_durtation = int(avl_range.duration.value)
 
-        self.need_offset = bool(avl_start != 0 and src_start != 0)
+        pre_gap_duration = 0
+        post_gap_duration = 0
 
         # if media start is les then clip requires
         if src_start < avl_start:
             # calculate gap
-            gap_duration = avl_start - src_start
-
-            # create gap data to disk
-            self._render_seqment(gap=gap_duration)
-            # generate used frames
-            self._generate_used_frames(gap_duration)
+            pre_gap_duration = avl_start - src_start
 
             # fix start and end to correct values
             start = 0
-            duration -= gap_duration
+            duration -= pre_gap_duration
 
         # if media duration is shorter then clip requirement
         if duration > avl_durtation:
             # calculate gap
             gap_start = int(src_start + avl_durtation)
             gap_end = int(src_start + duration)
-            gap_duration = gap_end - gap_start
-
-            # create gap data to disk
-            self._render_seqment(gap=gap_duration, end_offset=avl_durtation)
-            # generate used frames
-            self._generate_used_frames(gap_duration, end_offset=avl_durtation)
+            post_gap_duration = gap_end - gap_start
 
             # fix duration lenght
             duration = avl_durtation
 
         # return correct trimmed range
-        return trim_media_range(
+        trimmed_range = trim_media_range(
             avl_range, range_from_frames(start, duration, fps)
         )
+        return trimmed_range, pre_gap_duration, post_gap_duration
 
-    def _render_seqment(self, sequence=None,
-                        video=None, gap=None, end_offset=None):
+    def _add_segment(self, sequence=None, video=None, gap=None):
         """
-        Render seqment into image sequence frames.
+        Add segment to be rendered into image sequence frames.
 
-        Using ffmpeg to convert compatible video and image source
-        to defined image sequence format.
+        Segments are collected and rendered at once with `_render_segments`
+        so ffmpeg is launched only once per instance.
 
         Args:
-            sequence (list): input dir path string, collection object in list
+            sequence (list): input path string with frame number
+                pattern, first frame and frame duration in list
             video (list)[optional]: video_path string, otio_range in list
             gap (int)[optional]: gap duration
-            end_offset (int)[optional]: offset gap frame start in frames
-
-        Returns:
-            otio.time.TimeRange: trimmed available range
         """
         # Not all hosts can import this module.
         from ayon_core.pipeline.editorial import frames_to_seconds
 
-        # create path  and frame start to destination
-        output_path, out_frame_start = self._get_ffmpeg_output()
-
-        if end_offset:
-            out_frame_start += end_offset
-
-        # start command list
-        command = get_ffmpeg_tool_args("ffmpeg")
+        # frame start of the segment in destination sequence
+        _output_path, out_frame_start = self._get_ffmpeg_output()
 
+        input_args = []
         input_extension = None
         if sequence:
-            input_dir, collection = sequence
-            in_frame_start = min(collection.indexes)
-
             # converting image sequence to image sequence
-            input_file = collection.format("{head}{padding}{tail}")
-            input_path = os.path.join(input_dir, input_file)
+            input_path, in_frame_start, frame_duration = sequence
             input_extension = os.path.splitext(input_path)[-1]
 
-            # form command for rendering gap files
-            command.extend([
+            # form input arguments for image sequence
+            input_args.extend([
                 "-start_number", str(in_frame_start),
                 "-i", input_path
             ])
@@ -383,90 +470,178 @@ class ExtractOTIOReview(publish.Extractor):
             )
             input_extension = os.path.splitext(video_path)[-1]
 
-            # form command for rendering gap files
-            command.extend([
+            # form input arguments for video file
+            input_args.extend([
                 "-ss", str(sec_start),
                 "-t", str(sec_duration),
                 "-i", video_path
             ])
 
         elif gap:
+            previous = self._segments[-1] if self._segments else None
+            if (
+                previous
+                and previous["gap_fps"] == self.actual_fps
+                and previous["width"] == self.to_width
+                and previous["height"] == self.to_height
+            ):
+                # extend preceding black frames instead of adding another
+                #   input so consecutive gaps are generated at once
+                self._segments.pop()
+                gap += previous["frame_duration"]
+                out_frame_start = previous["out_frame_start"]
+
+            frame_duration = gap
             sec_duration = frames_to_seconds(gap, self.actual_fps)
 
-            # form command for rendering gap files
-            command.extend([
-                "-t", str(sec_duration),
-                "-r", str(self.actual_fps),
+            # form input arguments for black frames
+            input_args.extend([
                 "-f", "lavfi",
-                "-i", "color=c=black:s={}x{}".format(
-                    self.to_width, self.to_height
-                ),
-                "-tune", "stillimage"
+                "-i", "color=c=black:s={}x{}:r={}:d={}".format(
+                    self.to_width, self.to_height,
+                    self.actual_fps, sec_duration
+                )
             ])
 
-        # add output attributes
+        self._segments.append({
+            "out_frame_start": out_frame_start,
+            "frame_duration": int(frame_duration),
+            "input_args": input_args,
+            "width": self.to_width,
+            "height": self.to_height,
+            "gap_fps": self.actual_fps if gap else None,
+            "input_extension": input_extension,
+        })
+
+    def _render_segments(self):
+        """
+        Start rendering of all collected segments into image sequence frames.
+
+        Using single ffmpeg process to convert compatible video, image
+        and black frame sources to defined image sequence format. Segments
+        are joined with concat filter in order they were added. Single
+        segment matching output extension and resolution is stream copied.
+
+        Returns:
+            Union[concurrent.futures.Future, None]: Future of ffmpeg process
+                resulting with its output. None if there is nothing to render.
+        """
+        segments = self._segments
+        if not segments:
+            return None
+
+        # create path to destination
+        output_path, _out_frame_start = self._get_ffmpeg_output()
+
+        # start command list
+        # - keep ffmpeg quiet so only warnings and errors are piped back
+        command = list(_get_ffmpeg_args())
+        command.extend(["-hide_banner", "-loglevel", "warning"])
+
+        # concat filter requires all inputs with the same size, fallback to
+        #   resolution of first segment if instance doesn't define it
+        width, height = self._output_resolution or (
+            segments[0]["width"], segments[0]["height"]
+        )
+
+        # single source already in output format and resolution is copied
+        #   without decoding and encoding of its frames
+        if len(segments) == 1:
+            segment = segments[0]
+            if (
+                segment["input_extension"] == self.output_ext
+                and segment["width"] == width
+                and segment["height"] == height
+            ):
+                command.extend(segment["input_args"])
+                command.extend([
+                    "-frames:v", str(segment["frame_duration"]),
+                    "-start_number", str(segment["out_frame_start"]),
+                    "-c", "copy",
+                    output_path
+                ])
+                return self._submit_command(command)
+
+        # Trim each input to its frame duration and letterbox it to
+        #   the output resolution so all can be concatenated
+        filters = []
+        concat_inputs = ""
+        # JPEG output is encoded by mjpeg whose native pixel format is full
+        #   range yuv420, conform inputs to it before concat so the encoder
+        #   doesn't convert each frame again
+        pix_fmt_filter = ""
+        output_args = ["-threads", "0"]
+        if self.output_ext.lower() in (".jpg", ".jpeg"):
+            pix_fmt_filter = ",format=yuvj420p"
+            # pin quality, default mjpeg bitrate is low and varies per frame
+            output_args.extend(["-qscale:v", "2", "-pix_fmt", "yuvj420p"])
+
+        for index, segment in enumerate(segments):
+            command.extend(segment["input_args"])
+            filters.append(
+                "[{index}:v]trim=end_frame={duration},setpts=PTS-STARTPTS,"
+                "scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                "pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1"
+                "{pix_fmt_filter}[v{index}]".format(
+                    index=index,
+                    pix_fmt_filter=pix_fmt_filter,
+                    duration=segment["frame_duration"],
+                    width=width,
+                    height=height,
+                )
+            )
+            concat_inputs += "[v{}]".format(index)
+
+        filters.append("{}concat=n={}:v=1:a=0[out]".format(
+            concat_inputs, len(segments)
+        ))
+
         command.extend([
-            "-start_number", str(out_frame_start)
+            "-filter_complex", ";".join(filters),
+            "-map", "[out]",
+            # write each frame as it is without duplicating or dropping
+            "-vsync", "passthrough",
+            "-start_number", str(segments[0]["out_frame_start"]),
         ])
+        command.extend(output_args)
+        command.append(output_path)
 
-        # add copying if extensions are matching
-        if (
-            input_extension
-            and self.output_ext == input_extension
-        ):
-            command.extend([
-                "-c", "copy"
-            ])
+        return self._submit_command(command)
 
-        # add output path at the end
-        command.append(output_path)
+    def _submit_command(self, command):
+        """Execute ffmpeg command in background.
+
+        Args:
+            command (list[str]): ffmpeg command arguments.
 
-        # execute
+        Returns:
+            concurrent.futures.Future: Future resulting with process output.
+        """
         self.log.debug("Executing: {}".format(" ".join(command)))
-        output = run_subprocess(
-            command, logger=self.log
+        return self._get_render_executor().submit(
+            run_subprocess, command, logger=self.log
         )
-        self.log.debug("Output: {}".format(output))
 
-    def _generate_used_frames(self, duration, end_offset=None):
+    def _generate_used_frames(self, duration):
         """
-        Generating used frames into plugin argument `used_frames`.
+        Generating used frames by moving plugin frame cursor.
 
-        The argument `used_frames` is used for checking next available
-        frame to start with during rendering sequence segments.
+        The cursor is used for checking next available frame to start
+        with during rendering sequence segments.
 
         Args:
             duration (int): duration of frames needed to be generated
-            end_offset (int)[optional]: in case frames need to be offseted
 
         """
+        duration = int(duration)
+        if duration < 1:
+            return
 
-        padding = "{{:0{}d}}".format(self.padding)
-
-        # create frame offset
-        offset = 0
-        if self.need_offset:
-            offset = 1
-
-        if end_offset:
-            new_frames = list()
-            start_frame = self.used_frames[-1]
-            for index in range((end_offset + offset),
-                               (int(end_offset + duration) + offset)):
-                seq_number = padding.format(start_frame + index)
-                self.log.debug(
-                    "index: `{}` | seq_number: `{}`".format(index, seq_number))
-                new_frames.append(int(seq_number))
-            new_frames += self.used_frames
-            self.used_frames = new_frames
-        else:
-            for _i in range(1, (int(duration) + 1)):
-                if self.used_frames[-1] == self.workfile_start:
-                    seq_number = padding.format(self.used_frames[-1])
-                    self.workfile_start -= 1
-                else:
-                    seq_number = padding.format(self.used_frames[-1] + 1)
-                    self.used_frames.append(int(seq_number))
+        if self._first_frame_pending:
+            # cursor frame itself is used by first segment
+            self._first_frame_pending = False
+            duration -= 1
+        self._cursor += duration
 
     def _get_ffmpeg_output(self):
         """
@@ -477,17 +652,9 @@ class ExtractOTIOReview(publish.Extractor):
             int: out_frame_start is starting sequence frame
 
         """
-        output_file = "{}{}{}".format(
-            self.temp_file_head,
-            "%0{}d".format(self.padding),
-            self.output_ext
-        )
-        # create path to destination
-        output_path = os.path.join(self.staging_dir, output_file)
-
         # generate frame start
-        out_frame_start = self.used_frames[-1] + 1
-        if self.used_frames[-1] == self.workfile_start:
-            out_frame_start = self.used_frames[-1]
+        out_frame_start = self._cursor + 1
+        if self._first_frame_pending:
+            out_frame_start = self._cursor
 
-        return output_path, out_frame_start
+        return self._output_pattern, out_frame_start
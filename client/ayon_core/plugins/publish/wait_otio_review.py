@@ -0,0 +1,32 @@
+"""
+Requires:
+    instance -> otioReviewRenderFuture
+"""
+
+from pyblish import api
+
+
+class WaitOTIOReview(api.InstancePlugin):
+    """Wait for rendering of OTIO review image sequence.
+
+    `ExtractOTIOReview` renders review frames in background so ffmpeg
+    processes of all review instances can run at the same time. This
+    plugin waits for the rendering before the frames are used by other
+    extractors and reports the failure on the instance.
+
+    There is no host or family filter so the plugin can't miss any instance
+    `ExtractOTIOReview` processed, instances without the rendering are
+    skipped.
+    """
+
+    order = api.ExtractorOrder - 0.449
+    label = "Wait for OTIO review"
+
+    def process(self, instance):
+        future = instance.data.pop("otioReviewRenderFuture", None)
+        if future is None:
+            return
+
+        # raises an error when ffmpeg failed
+        output = future.result()
+        self.log.debug("Output: {}".format(output))